@@ -0,0 +1,170 @@
+#!/usr/bin/env bash
+# Compressed-input throughput benchmark: zstd vs gzip (zlib and rapidgzip).
+# Generates 3GB synthetic FASTQ on a tmpfs/ramfs mount, compresses it with BGZFWriter and
+# ZstdWriter (timed), then times parsing each compressed copy with hyperfine.
+# Run from repository root: ./benchmark/throughput/run_throughput_compressed_benchmarks.sh [--ramfs|--tmpfs]
+# Requires: pixi, hyperfine. On Linux: sudo for ramfs/tmpfs mount/umount.
+
+set -e
+
+# --- Mount type: tmpfs (default) or --ramfs/--tmpfs ---
+BENCH_FS="tmpfs"
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --ramfs) BENCH_FS="ramfs"; shift ;;
+        --tmpfs) BENCH_FS="tmpfs"; shift ;;
+        *) break ;;
+    esac
+done
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+REPO_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+cd "$REPO_ROOT"
+
+# Ensure common tool install locations are on PATH
+export PATH="${HOME}/.cargo/bin:${HOME}/.local/bin:${PATH}"
+if [ -n "${CONDA_PREFIX}" ] && [ -d "${CONDA_PREFIX}/bin" ]; then
+    export PATH="${CONDA_PREFIX}/bin:${PATH}"
+fi
+if [ -n "${MAMBA_ROOT_PREFIX}" ] && [ -d "${MAMBA_ROOT_PREFIX}/bin" ]; then
+    export PATH="${MAMBA_ROOT_PREFIX}/bin:${PATH}"
+fi
+
+# --- Toolchain checks ---
+missing=()
+check_cmd() { command -v "$1" >/dev/null 2>&1; }
+check_cmd pixi      || missing+=(pixi)
+check_cmd hyperfine || missing+=(hyperfine)
+
+if [ ${#missing[@]} -gt 0 ]; then
+    echo "Missing required tool(s): ${missing[*]}"
+    echo "  pixi:      https://pixi.sh"
+    echo "  hyperfine: https://github.com/sharkdp/hyperfine (e.g. cargo install hyperfine)"
+    echo "PATH used: $PATH"
+    exit 1
+fi
+
+# --- Hyperfine configuration ---
+# Number of warmup runs and measured runs; override via env:
+#   WARMUP_RUNS=1 HYPERFINE_RUNS=10 ./benchmark/throughput/run_throughput_compressed_benchmarks.sh
+WARMUP_RUNS="${WARMUP_RUNS:-3}"
+HYPERFINE_RUNS="${HYPERFINE_RUNS:-15}"
+
+# --- Threads ---
+# Compression threads (BGZFWriter, ZstdWriter) and rapidgzip decompression threads; 0 = auto.
+# Override via env: THREADS=8 ./benchmark/throughput/run_throughput_compressed_benchmarks.sh
+THREADS="${THREADS:-4}"
+
+# --- CPU pinning configuration (Linux only, optional) ---
+# Default: no pinning (all cores); set BENCH_CPUS=0-15 etc. to restrict.
+BENCH_CPUS="${BENCH_CPUS:-}"
+
+hyperfine_cmd() {
+    if [ -n "$BENCH_CPUS" ] && [ "$(uname -s)" = "Linux" ] && command -v taskset >/dev/null 2>&1; then
+        taskset -c "$BENCH_CPUS" hyperfine "$@"
+    else
+        hyperfine "$@"
+    fi
+}
+
+# --- Ramfs/tmpfs mount (minimize disk I/O; no swap) ---
+BENCH_DIR=$(mktemp -d)
+BENCH_FILE="${BENCH_DIR}/throughput_bench_3g.fastq"
+MOUNTED=0
+
+cleanup_mount() {
+    if [ "$MOUNTED" = 1 ]; then
+        if ! sudo umount "$BENCH_DIR" 2>/dev/null; then
+            echo "Warning: Failed to unmount $BENCH_DIR. Please run: sudo umount $BENCH_DIR && rmdir $BENCH_DIR"
+        else
+            rmdir "$BENCH_DIR" 2>/dev/null || true
+        fi
+    else
+        rm -rf "$BENCH_DIR"
+    fi
+}
+trap cleanup_mount EXIT
+
+case "$(uname -s)" in
+    Linux)
+        if [ "$BENCH_FS" = "tmpfs" ]; then
+            _mount_cmd="sudo mount -t tmpfs -o size=6G tmpfs $BENCH_DIR"
+        else
+            _mount_cmd="sudo mount -t ramfs ramfs $BENCH_DIR"
+        fi
+        if $_mount_cmd 2>/dev/null; then
+            MOUNTED=1
+            sudo chown "$(id -u):$(id -g)" "$BENCH_DIR"
+        else
+            echo "Failed to mount $BENCH_FS on $BENCH_DIR. Ensure sudo is available."
+            echo "Fallback: using /dev/shm (no mount)."
+            rmdir "$BENCH_DIR" 2>/dev/null || true
+            BENCH_DIR="/dev/shm/blazeseq_throughput_bench_$$"
+            mkdir -p "$BENCH_DIR"
+            BENCH_FILE="${BENCH_DIR}/throughput_bench_3g.fastq"
+        fi
+        ;;
+    Darwin)
+        echo "macOS: using temporary directory (not a ramdisk). See Benchmarking.md for ramdisk setup."
+        ;;
+    *)
+        echo "Unknown OS: using temporary directory."
+        ;;
+esac
+
+# --- Generate 3GB synthetic FASTQ ---
+echo "Generating 3GB synthetic FASTQ at $BENCH_FILE ..."
+if ! pixi run mojo run -I . "$SCRIPT_DIR/../fastq-parser/generate_synthetic_fastq.mojo" "$BENCH_FILE" 3; then
+    echo "Failed to generate 3GB FASTQ at $BENCH_FILE (check space on mounted ramfs)."
+    exit 1
+fi
+
+# --- Build BlazeSeq compressed throughput runner ---
+RUNNER_BIN="$SCRIPT_DIR/run_throughput_compressed_blazeseq"
+echo "Building compressed throughput runner ..."
+if ! pixi run mojo build -I . -o "$RUNNER_BIN" "$SCRIPT_DIR/run_throughput_compressed_blazeseq.mojo"; then
+    echo "Failed to build run_throughput_compressed_blazeseq. Check Mojo toolchain and blazeseq package."
+    exit 1
+fi
+
+# --- Compression (timed once per backend; also produces the inputs below) ---
+# write_zstd runs after write_zstd_ldm, so the decoders read the default-settings .zst.
+echo "Compressing with BGZFWriter and ZstdWriter (threads=${THREADS}) ..."
+hyperfine_cmd \
+    --runs 1 \
+    --export-markdown "$REPO_ROOT/throughput_compressed_write_results.md" \
+    --export-json "$REPO_ROOT/throughput_compressed_write_results.json" \
+    -n write_zstd_ldm "$RUNNER_BIN $BENCH_FILE write-zstd-ldm $THREADS" \
+    -n write_zstd     "$RUNNER_BIN $BENCH_FILE write-zstd $THREADS" \
+    -n write_bgzf     "$RUNNER_BIN $BENCH_FILE write-bgzf $THREADS"
+ls -l "$BENCH_FILE" "$BENCH_FILE.gz" "$BENCH_FILE.zst"
+
+# --- Optional: verify all decoders agree on record/base count (non-fatal) ---
+echo "Verifying decoder outputs..."
+ref=""
+for mode in zstd rapidgzip gzip; do
+    out=$("$RUNNER_BIN" "$BENCH_FILE" "$mode" "$THREADS" 2>/dev/null) || out=""
+    if [ -z "$out" ]; then
+        echo "Warning: $mode produced no output"
+    elif [ -z "$ref" ]; then
+        ref="$out"
+    fi
+    if [ -n "$out" ] && [ "$out" != "$ref" ]; then
+        echo "Warning: $mode output '$out' differs from reference '$ref'"
+    fi
+done
+echo "Reference counts: ${ref:- (none; one or more runs failed)}"
+
+# --- Hyperfine ---
+echo "Running hyperfine (warmup=${WARMUP_RUNS}, runs=${HYPERFINE_RUNS}, threads=${THREADS}) ..."
+hyperfine_cmd \
+    --warmup "${WARMUP_RUNS}" \
+    --runs "${HYPERFINE_RUNS}" \
+    --export-markdown "$REPO_ROOT/throughput_compressed_benchmark_results.md" \
+    --export-json "$REPO_ROOT/throughput_compressed_benchmark_results.json" \
+    -n zstd      "$RUNNER_BIN $BENCH_FILE zstd" \
+    -n rapidgzip "$RUNNER_BIN $BENCH_FILE rapidgzip $THREADS" \
+    -n gzip      "$RUNNER_BIN $BENCH_FILE gzip"
+
+echo ""
+echo "Results written to throughput_compressed_benchmark_results.md/.json and throughput_compressed_write_results.md/.json"
@@ -0,0 +1,190 @@
+#!/usr/bin/env bash
+# Throughput scaling benchmark: ParallelFastqParser with 1..N worker threads.
+# Generates 3GB synthetic FASTQ on a tmpfs/ramfs mount, runs each thread count with hyperfine.
+# Run from repository root: ./benchmark/throughput/run_throughput_parallel_benchmarks.sh [--ramfs|--tmpfs]
+# Requires: pixi, hyperfine. On Linux: sudo for ramfs/tmpfs mount/umount.
+
+set -e
+
+# --- Mount type: tmpfs (default) or --ramfs/--tmpfs ---
+BENCH_FS="tmpfs"
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --ramfs) BENCH_FS="ramfs"; shift ;;
+        --tmpfs) BENCH_FS="tmpfs"; shift ;;
+        *) break ;;
+    esac
+done
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+REPO_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+cd "$REPO_ROOT"
+
+# Ensure common tool install locations are on PATH
+export PATH="${HOME}/.cargo/bin:${HOME}/.local/bin:${PATH}"
+if [ -n "${CONDA_PREFIX}" ] && [ -d "${CONDA_PREFIX}/bin" ]; then
+    export PATH="${CONDA_PREFIX}/bin:${PATH}"
+fi
+if [ -n "${MAMBA_ROOT_PREFIX}" ] && [ -d "${MAMBA_ROOT_PREFIX}/bin" ]; then
+    export PATH="${MAMBA_ROOT_PREFIX}/bin:${PATH}"
+fi
+
+# --- Toolchain checks ---
+missing=()
+check_cmd() { command -v "$1" >/dev/null 2>&1; }
+check_cmd pixi      || missing+=(pixi)
+check_cmd hyperfine || missing+=(hyperfine)
+
+if [ ${#missing[@]} -gt 0 ]; then
+    echo "Missing required tool(s): ${missing[*]}"
+    echo "  pixi:      https://pixi.sh"
+    echo "  hyperfine: https://github.com/sharkdp/hyperfine (e.g. cargo install hyperfine)"
+    echo "PATH used: $PATH"
+    exit 1
+fi
+
+# --- Hyperfine configuration ---
+# Number of warmup runs and measured runs; override via env:
+#   WARMUP_RUNS=1 HYPERFINE_RUNS=10 ./benchmark/throughput/run_throughput_parallel_benchmarks.sh
+WARMUP_RUNS="${WARMUP_RUNS:-3}"
+HYPERFINE_RUNS="${HYPERFINE_RUNS:-15}"
+
+# --- Thread counts and chunk size ---
+# Override via env: THREAD_COUNTS="1 2 4" CHUNK_MB=8 ./benchmark/throughput/run_throughput_parallel_benchmarks.sh
+THREAD_COUNTS="${THREAD_COUNTS:-1 2 4 8 16 32}"
+CHUNK_MB="${CHUNK_MB:-4}"
+
+# --- CPU pinning configuration (Linux only, optional) ---
+# Default: no pinning (all cores); set BENCH_CPUS=0-15 etc. to restrict.
+BENCH_CPUS="${BENCH_CPUS:-}"
+
+hyperfine_cmd() {
+    if [ -n "$BENCH_CPUS" ] && [ "$(uname -s)" = "Linux" ] && command -v taskset >/dev/null 2>&1; then
+        taskset -c "$BENCH_CPUS" hyperfine "$@"
+    else
+        hyperfine "$@"
+    fi
+}
+
+# --- Ramfs/tmpfs mount (minimize disk I/O; no swap) ---
+BENCH_DIR=$(mktemp -d)
+BENCH_FILE="${BENCH_DIR}/throughput_bench_3g.fastq"
+MOUNTED=0
+
+cleanup_mount() {
+    if [ "$MOUNTED" = 1 ]; then
+        if ! sudo umount "$BENCH_DIR" 2>/dev/null; then
+            echo "Warning: Failed to unmount $BENCH_DIR. Please run: sudo umount $BENCH_DIR && rmdir $BENCH_DIR"
+        else
+            rmdir "$BENCH_DIR" 2>/dev/null || true
+        fi
+    else
+        rm -rf "$BENCH_DIR"
+    fi
+}
+trap cleanup_mount EXIT
+
+case "$(uname -s)" in
+    Linux)
+        if [ "$BENCH_FS" = "tmpfs" ]; then
+            _mount_cmd="sudo mount -t tmpfs -o size=5G tmpfs $BENCH_DIR"
+        else
+            _mount_cmd="sudo mount -t ramfs ramfs $BENCH_DIR"
+        fi
+        if $_mount_cmd 2>/dev/null; then
+            MOUNTED=1
+            sudo chown "$(id -u):$(id -g)" "$BENCH_DIR"
+        else
+            echo "Failed to mount $BENCH_FS on $BENCH_DIR. Ensure sudo is available."
+            echo "Fallback: using /dev/shm (no mount)."
+            rmdir "$BENCH_DIR" 2>/dev/null || true
+            BENCH_DIR="/dev/shm/blazeseq_throughput_bench_$$"
+            mkdir -p "$BENCH_DIR"
+            BENCH_FILE="${BENCH_DIR}/throughput_bench_3g.fastq"
+        fi
+        ;;
+    Darwin)
+        echo "macOS: using temporary directory (not a ramdisk). See Benchmarking.md for ramdisk setup."
+        ;;
+    *)
+        echo "Unknown OS: using temporary directory."
+        ;;
+esac
+
+# --- Generate 3GB synthetic FASTQ ---
+echo "Generating 3GB synthetic FASTQ at $BENCH_FILE ..."
+if ! pixi run mojo run -I . "$SCRIPT_DIR/../fastq-parser/generate_synthetic_fastq.mojo" "$BENCH_FILE" 3; then
+    echo "Failed to generate 3GB FASTQ at $BENCH_FILE (check space on mounted ramfs)."
+    exit 1
+fi
+
+# --- Build BlazeSeq parallel throughput runner ---
+RUNNER_BIN="$SCRIPT_DIR/run_throughput_parallel_blazeseq"
+echo "Building parallel throughput runner ..."
+if ! pixi run mojo build -I . -o "$RUNNER_BIN" "$SCRIPT_DIR/run_throughput_parallel_blazeseq.mojo"; then
+    echo "Failed to build run_throughput_parallel_blazeseq. Check Mojo toolchain and blazeseq package."
+    exit 1
+fi
+
+# --- Optional: verify all thread counts agree on record/base count (non-fatal) ---
+echo "Verifying thread-count outputs..."
+ref=""
+for t in $THREAD_COUNTS; do
+    out=$("$RUNNER_BIN" "$BENCH_FILE" "$t" "$CHUNK_MB" 2>/dev/null) || out=""
+    if [ -z "$out" ]; then
+        echo "Warning: threads=$t produced no output"
+    elif [ -z "$ref" ]; then
+        ref="$out"
+    fi
+    if [ -n "$out" ] && [ "$out" != "$ref" ]; then
+        echo "Warning: threads=$t output '$out' differs from reference '$ref'"
+    fi
+done
+echo "Reference counts: ${ref:- (none; one or more runs failed)}"
+
+# --- Hyperfine ---
+hf_args=()
+for t in $THREAD_COUNTS; do
+    hf_args+=(-n "threads_$t" "$RUNNER_BIN $BENCH_FILE $t $CHUNK_MB")
+done
+
+echo "Running hyperfine (warmup=${WARMUP_RUNS}, runs=${HYPERFINE_RUNS}, threads=${THREAD_COUNTS}) ..."
+hyperfine_cmd \
+    --warmup "${WARMUP_RUNS}" \
+    --runs "${HYPERFINE_RUNS}" \
+    --export-markdown "$REPO_ROOT/throughput_parallel_benchmark_results.md" \
+    --export-json "$REPO_ROOT/throughput_parallel_benchmark_results.json" \
+    "${hf_args[@]}"
+
+# --- Scaling table: threads vs GB/s, with the machine it was measured on ---
+SCALING_MD="$REPO_ROOT/throughput_parallel_scaling.md"
+if command -v python3 >/dev/null 2>&1; then
+    CPU_MODEL=$( (lscpu 2>/dev/null | sed -n 's/^Model name: *//p' | head -n1) || true)
+    [ -z "$CPU_MODEL" ] && CPU_MODEL=$(sysctl -n machdep.cpu.brand_string 2>/dev/null || echo unknown)
+    LOGICAL_CPUS=$(getconf _NPROCESSORS_ONLN 2>/dev/null || echo unknown)
+    MEM_GB=$(awk '/MemTotal/ {printf "%.0f", $2 / 1048576}' /proc/meminfo 2>/dev/null || true)
+    MOJO_VERSION=$(pixi run mojo --version 2>/dev/null | tail -n1 || echo unknown)
+    BENCH_SIZE=$(wc -c < "$BENCH_FILE")
+    MACHINE="${CPU_MODEL}, ${LOGICAL_CPUS} logical CPUs, ${MEM_GB:-?} GB RAM, $(uname -sr), ${MOJO_VERSION}, input on ${BENCH_FS}"
+    python3 - "$REPO_ROOT/throughput_parallel_benchmark_results.json" "$BENCH_SIZE" "$MACHINE" "$CHUNK_MB" > "$SCALING_MD" <<'PY'
+import json, sys
+
+path, size, machine, chunk_mb = sys.argv[1], int(sys.argv[2]), sys.argv[3], sys.argv[4]
+results = json.load(open(path))["results"]
+base = results[0]["mean"]
+print(f"Machine: {machine}. Chunk size {chunk_mb} MB, {size / 1e9:.2f} GB input.\n")
+print("| Threads | Mean time (s) | Throughput (GB/s) | Speedup |")
+print("|--------:|--------------:|------------------:|--------:|")
+for r in results:
+    threads = r["command"].removeprefix("threads_")
+    print(
+        f"| {threads} | {r['mean']:.3f} ± {r['stddev']:.3f} "
+        f"| {size / 1e9 / r['mean']:.2f} | {base / r['mean']:.2f}x |"
+    )
+PY
+    cat "$SCALING_MD"
+fi
+
+echo ""
+echo "Results written to throughput_parallel_benchmark_results.md and throughput_parallel_benchmark_results.json"
+echo "Scaling table (threads vs GB/s): throughput_parallel_scaling.md"
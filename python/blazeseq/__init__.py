@@ -12,11 +12,42 @@ Usage:
     for batch in p.batches:
         for rec in batch:
             ...
+        cols = batch.to_numpy()      # zero-copy NumPy views of the SoA buffers
+        table = batch.to_arrow()     # pyarrow.RecordBatch (id, sequence, quality)
+    # BED intervals as columnar batches
+    for batch in blazeseq.bed_parser("peaks.bed").batches:
+        cols = batch.to_numpy()      # chrom_id, start, end, strand, score, ...
+        chroms = batch.chrom_names() # cols["chrom_id"] indexes this list
+    # FastQC-style counters collected while parsing
+    qc = blazeseq.qc_stats()
+    for batch in p.batches:
+        qc.add(batch, num_threads=4)
+    arrays = qc.to_numpy()           # position_quality is (max_length, 94), ...
+    # hand a batch to another process through shared memory (one memcpy)
+    shm = batch.to_shared_memory()   # worker: blazeseq.batch_from_buffer(shm.buf)
+    # one of 8 record-aligned byte ranges (e.g. per multiprocessing worker)
+    p = blazeseq.shard_parser("file.fastq", shard_index=3, num_shards=8)
+    # bytes, file-like objects and "-" (stdin) work too; gzip is sniffed
+    p = blazeseq.parser(sys.stdin.buffer)
+    p = blazeseq.parser(gzip_bytes)
+    # parse ahead on a background thread (GIL released while parsing)
+    for batch in p.prefetch_batches(batch_size=10_000, prefetch=4):
+        ...
+    async for batch in p.prefetch_batches():   # asyncio variant
+        ...
 """
 
 from __future__ import annotations
 
+import asyncio
+import ctypes
+import gzip
+import os
+import queue
+import struct
 import sys
+import threading
+import weakref
 from pathlib import Path
 from typing import Any, Iterator, Protocol, cast
 
@@ -27,6 +58,61 @@ _mod: Any = _get_extension_module()
 # Default batch size for parser.batches iteration
 _DEFAULT_BATCH_SIZE = 100
 
+# Records parsed per native read_columns() call when iterating parser.records
+_COLUMN_CHUNK_SIZE = 1024
+
+# Batches parser.batches keeps track of for recycling
+_RECYCLE_POOL_SIZE = 4
+
+# Native parser methods callable while record iteration has buffered records
+_NON_READING_PARSER_METHODS = frozenset({"quality_offset"})
+
+# Default number of batches parsed ahead by parser.prefetch_batches()
+_DEFAULT_PREFETCH = 2
+
+# Leading bytes of gzip data; parser() sniffs these to detect compression
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Default batch size for bed_parser(...).batches iteration
+_DEFAULT_BED_BATCH_SIZE = 65536
+
+# SoA buffers of a FastqBatch and their element types (NumPy typestr)
+_BATCH_BUFFERS = {
+    "sequence": "|u1",
+    "quality": "|u1",
+    "id": "|u1",
+    "ends": "<i8",
+    "id_ends": "<i8",
+}
+
+# Serialized FastqBatch (FastqBatch.serialize_into): 64-byte little-endian
+# header (magic, version, num_records, id bytes, sequence bytes, quality
+# offset) followed by id_ends, ends, id, sequence and quality
+_BATCH_MAGIC = 0x42515342
+_BATCH_FORMAT_VERSION = 1
+_BATCH_HEADER = struct.Struct("<IIQQQB")
+_BATCH_HEADER_SIZE = 64
+
+# Column buffers of a BedBatch and their element types (NumPy typestr)
+_BED_BATCH_BUFFERS = {
+    "chrom_id": "<u4",
+    "start": "<u8",
+    "end": "<u8",
+    "strand": "|S1",
+    "score": "<u2",
+    "name": "|u1",
+    "name_ends": "<i8",
+}
+
+# Counter arrays of a QCStats and their number of columns (0 = one-dimensional)
+_QC_BUFFERS = {
+    "position_quality": 94,
+    "position_bases": 5,
+    "gc_histogram": 0,
+    "length_counts": 0,
+    "mean_quality": 0,
+}
+
 
 # ---------------------------------------------------------------------------
 # Protocol definitions for type checkers (extension types are dynamic at runtime)
@@ -76,6 +162,38 @@ class FastqBatchProtocol(Protocol):
         """Iterate over records in the batch."""
         ...
 
+    def quality_offset(self) -> int:
+        """Return the Phred offset (33 or 64) of the batch."""
+        ...
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Zero-copy NumPy views of the batch buffers (requires numpy)."""
+        ...
+
+    def to_arrow(self, binary: bool = False) -> Any:
+        """pyarrow.RecordBatch with id, sequence, quality columns (requires pyarrow)."""
+        ...
+
+
+class BedBatchProtocol(Protocol):
+    """Protocol for a columnar batch of BED intervals."""
+
+    def num_records(self) -> int:
+        """Return the number of rows in the batch."""
+        ...
+
+    def num_fields(self) -> int:
+        """Return the number of BED columns (3-6) present in every row."""
+        ...
+
+    def chrom_names(self) -> list[str]:
+        """Return the interned chromosome names indexed by the chrom_id column."""
+        ...
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Zero-copy NumPy views of the column buffers (requires numpy)."""
+        ...
+
 
 class ParserProtocol(Protocol):
     """Protocol for the FASTQ parser returned by parser()."""
@@ -96,6 +214,10 @@ class ParserProtocol(Protocol):
         """Return a batch of up to max_records records."""
         ...
 
+    def next_batch_nogil(self, max_records: int) -> FastqBatchProtocol:
+        """Like next_batch, but parses with the GIL released."""
+        ...
+
 
 def _get_prop(raw: Any, name: str) -> Any:
     """Get attribute from extension record; call if method (so id/sequence/quality/phred_scores work as properties)."""
@@ -139,14 +261,39 @@ class _FastqRecordWrapper:
         return getattr(self._raw, name)
 
 
-def _next_or_stop(mojo_iter: Any) -> FastqRecordProtocol:
-    """Call __next__ on a Mojo iterator; raise StopIteration when exhausted."""
-    try:
-        return _wrap_record(mojo_iter.__next__())
-    except Exception as e:
-        if "StopIteration" in str(e):
-            raise StopIteration from e
-        raise
+class _ColumnRecord:
+    """Plain-Python FASTQ record built from read_columns()/columns() output.
+
+    Holds the str fields directly, so reading id/sequence/quality costs no
+    call into the extension.
+    """
+
+    __slots__ = ("id", "sequence", "quality", "_offset")
+
+    def __init__(self, id: str, sequence: str, quality: str, offset: int) -> None:
+        self.id = id
+        self.sequence = sequence
+        self.quality = quality
+        self._offset = offset
+
+    @property
+    def phred_scores(self) -> list[int]:
+        offset = self._offset
+        return [q - offset for q in self.quality.encode("ascii")]
+
+    def __len__(self) -> int:
+        return len(self.sequence)
+
+    def __repr__(self) -> str:
+        return f"FastqRecord(id={self.id!r}, sequence={self.sequence!r}, quality={self.quality!r})"
+
+
+def _column_records(columns: dict[str, list[str]], offset: int) -> list[_ColumnRecord]:
+    """Turn one {"id", "sequence", "quality"} dict into records."""
+    return [
+        _ColumnRecord(i, s, q, offset)
+        for i, s, q in zip(columns["id"], columns["sequence"], columns["quality"])
+    ]
 
 
 class _BatchesIterator:
@@ -168,6 +315,168 @@ class _BatchesIterator:
         return batch
 
 
+class _RecyclingBatchesIterator:
+    """Batch iterator that refills native batches in place (FASTQ parsers).
+
+    A native batch is refilled only after its wrapper has been collected.
+    Callers, NumPy views and Arrow buffers all hold the wrapper, so a batch
+    that is still in use is never overwritten; at most
+    _RECYCLE_POOL_SIZE batches are tracked.
+    """
+
+    __slots__ = ("_parser", "_batch_size", "_max_bytes", "_handed_out")
+
+    def __init__(self, parser: _IterableParser, batch_size: int, max_bytes: int) -> None:
+        self._parser = parser
+        self._batch_size = batch_size
+        self._max_bytes = max_bytes
+        # (native batch, weak reference to the wrapper returned for it)
+        self._handed_out: list[tuple[Any, weakref.ref[_IterableBatch]]] = []
+
+    def __iter__(self) -> _RecyclingBatchesIterator:
+        return self
+
+    def _spare(self) -> _IterableBatch:
+        for i, (native, wrapper) in enumerate(self._handed_out):
+            if wrapper() is None:
+                del self._handed_out[i]
+                return _IterableBatch(native)
+        return _IterableBatch(_mod.empty_batch())
+
+    def __next__(self) -> _IterableBatch:
+        batch = self._spare()
+        if self._parser.next_batch_into(batch, self._batch_size, self._max_bytes) == 0:
+            self._handed_out.clear()
+            raise StopIteration
+        self._handed_out.append((batch._batch, weakref.ref(batch)))
+        if len(self._handed_out) > _RECYCLE_POOL_SIZE:
+            # still referenced by its wrapper; stop tracking it
+            del self._handed_out[0]
+        return batch
+
+
+class _PrefetchFailure:
+    """Carries an exception from the prefetch thread to the consumer."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_PREFETCH_DONE = object()
+
+
+class _PrefetchingBatchIterator:
+    """Parses batches ahead of the consumer on a background thread.
+
+    The worker calls the extension's next_batch_nogil(), which releases the GIL
+    while parsing and decompressing, and hands batches over through a bounded
+    queue of `prefetch` entries. Python-side processing of one batch therefore
+    overlaps parsing of the next ones. Works with both `for` and `async for`.
+
+    The parser must not be used directly while the iterator is active. Call
+    close() (or use it as a context manager) to stop early.
+    """
+
+    __slots__ = ("_parser", "_batch_size", "_queue", "_stop", "_thread", "_done")
+
+    def __init__(self, parser: _IterableParser, batch_size: int, prefetch: int) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if prefetch < 1:
+            raise ValueError("prefetch must be >= 1")
+        self._parser = parser
+        self._batch_size = batch_size
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._done = False
+        self._thread = threading.Thread(
+            target=self._run, name="blazeseq-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        """Block until item is queued or close() is called; return False when stopped."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self) -> Any:
+        """Block until the worker hands over an item; _PREFETCH_DONE once close() is called."""
+        while not self._stop.is_set():
+            try:
+                return self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _PREFETCH_DONE
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                raw = self._parser._parser.next_batch_nogil(self._batch_size)
+                if raw.num_records() == 0:
+                    break
+                if not self._put(_IterableBatch(raw)):
+                    return
+        except BaseException as e:  # noqa: BLE001 - re-raised in the consumer
+            self._put(_PrefetchFailure(e))
+            return
+        self._put(_PREFETCH_DONE)
+
+    def _unwrap(self, item: Any) -> _IterableBatch:
+        if item is _PREFETCH_DONE:
+            self._done = True
+            raise StopIteration
+        if isinstance(item, _PrefetchFailure):
+            self._done = True
+            raise item.error
+        return item
+
+    def __iter__(self) -> _PrefetchingBatchIterator:
+        return self
+
+    def __next__(self) -> _IterableBatch:
+        if self._done:
+            raise StopIteration
+        return self._unwrap(self._get())
+
+    def __aiter__(self) -> _PrefetchingBatchIterator:
+        return self
+
+    async def __anext__(self) -> _IterableBatch:
+        if self._done:
+            raise StopAsyncIteration
+        loop = asyncio.get_running_loop()
+        # _get() returns once close() is called, so a pending await never hangs.
+        item = await loop.run_in_executor(None, self._get)
+        try:
+            return self._unwrap(item)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    def close(self) -> None:
+        """Stop the worker thread and discard batches that were parsed ahead."""
+        self._stop.set()
+        self._done = True
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._thread.join()
+
+    def __enter__(self) -> _PrefetchingBatchIterator:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
 class _BatchesIterable:
     """Iterable over batches; each iteration returns a new iterator over batches."""
 
@@ -185,18 +494,52 @@ class _BatchesIterable:
         return _BatchesIterator(self._parser, self._batch_size)
 
 
+class _FastqBatchesIterable(_BatchesIterable):
+    """Iterable over FASTQ batches, recycling batch buffers between iterations."""
+
+    __slots__ = ("_max_bytes",)
+
+    def __init__(
+        self,
+        parser: _IterableParser,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        max_bytes: int = 0,
+    ) -> None:
+        super().__init__(parser, batch_size)
+        self._max_bytes = max_bytes
+
+    def __iter__(self) -> _RecyclingBatchesIterator:  # type: ignore[override]
+        return _RecyclingBatchesIterator(self._parser, self._batch_size, self._max_bytes)
+
+
 class _IterableParser:
     """
     Wrapper so that parser.records and parser.batches work.
 
     Delegates to the Mojo parser. Supports iteration (for rec in parser),
-    .records, .batches, .batches_with_size(n), .has_more(), .next_record(), .next_batch(n).
+    .records, .batches, .batches_with_size(n), .has_more(), .next_record(),
+    .next_batch(n) and .read_columns(n).
+
+    Record iteration reads _COLUMN_CHUNK_SIZE records per native
+    read_columns() call and yields them from a local buffer; has_more() and
+    next_record() take that buffer into account.
     """
 
-    __slots__ = ("_parser",)
+    __slots__ = ("_parser", "_pending", "_offset", "_source")
 
-    def __init__(self, parser: Any) -> None:
+    def __init__(self, parser: Any, source: Any = None) -> None:
         self._parser = parser
+        self._pending: list[_ColumnRecord] = []
+        self._offset = int(parser.quality_offset())
+        # keeps in-memory input (parsed in place) or the stream alive
+        self._source = source
+
+    def _check_no_pending(self, method: str) -> None:
+        if self._pending:
+            raise RuntimeError(
+                f"parser.{method}() called with {len(self._pending)} records still "
+                "buffered by record iteration; finish iterating first"
+            )
 
     @property
     def records(self) -> _IterableParser:
@@ -204,74 +547,709 @@ class _IterableParser:
         return self
 
     @property
-    def batches(self) -> _BatchesIterable:
-        """Iterable over batches (default size 100): for batch in parser.batches"""
-        return _BatchesIterable(self, _DEFAULT_BATCH_SIZE)
+    def batches(self) -> _FastqBatchesIterable:
+        """Iterable over batches (default size 100): for batch in parser.batches
 
-    def batches_with_size(self, batch_size: int) -> _BatchesIterable:
-        """Iterable over batches of the given size: for batch in parser.batches_with_size(50)"""
-        return _BatchesIterable(self, batch_size)
+        Batch buffers are recycled once a batch is no longer referenced.
+        """
+        return _FastqBatchesIterable(self, _DEFAULT_BATCH_SIZE)
+
+    def batches_with_size(self, batch_size: int, max_bytes: int = 0) -> _FastqBatchesIterable:
+        """Iterable over batches of the given size: for batch in parser.batches_with_size(50)
+
+        max_bytes > 0 also ends a batch once it holds that many bytes of
+        id, sequence and quality data, keeping memory flat for long reads.
+        """
+        return _FastqBatchesIterable(self, batch_size, max_bytes)
+
+    def prefetch_batches(
+        self,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        prefetch: int = _DEFAULT_PREFETCH,
+    ) -> _PrefetchingBatchIterator:
+        """Iterate over batches parsed up to `prefetch` batches ahead on a background thread.
+
+        Parsing runs with the GIL released, so NumPy/Python work on the current
+        batch overlaps parsing of the next. Supports `for` and `async for`.
+        """
+        self._check_no_pending("prefetch_batches")
+        return _PrefetchingBatchIterator(self, batch_size, prefetch)
 
     def __iter__(self) -> _IterableParser:
         return self
 
     def __next__(self) -> FastqRecordProtocol:
-        return _next_or_stop(self._parser)
+        if not self._pending:
+            chunk = _column_records(
+                self._parser.read_columns(_COLUMN_CHUNK_SIZE), self._offset
+            )
+            if not chunk:
+                raise StopIteration
+            chunk.reverse()
+            self._pending = chunk
+        return self._pending.pop()
+
+    def has_more(self) -> bool:
+        """Return True if there may be more records to read."""
+        return bool(self._pending) or bool(self._parser.has_more())
 
     def next_record(self) -> FastqRecordProtocol:
         """Return the next record with id, sequence, quality, phred_scores as properties."""
+        if self._pending:
+            return self._pending.pop()
         return _wrap_record(self._parser.next_record())
 
     def next_batch(self, max_records: int) -> _IterableBatch:
         """Return an iterable batch of up to max_records records."""
+        self._check_no_pending("next_batch")
         return _IterableBatch(self._parser.next_batch(max_records))
 
+    def next_batch_into(self, batch: _IterableBatch, max_records: int, max_bytes: int = 0) -> int:
+        """Clear batch and refill it in place with up to max_records records; return the count.
+
+        The batch's buffers are reused. Arrays from its to_numpy()/to_arrow()
+        must no longer be in use. max_bytes > 0 also ends the batch once it
+        holds that many bytes of record data.
+        """
+        self._check_no_pending("next_batch_into")
+        return int(self._parser.next_batch_into(batch._batch, max_records, max_bytes))
+
+    def read_columns(self, max_records: int) -> dict[str, list[str]]:
+        """Parse up to max_records records into {"id", "sequence", "quality"} lists of str.
+
+        The lists are built in one native call with no per-record objects, so
+        the result can go straight into pandas.DataFrame or polars.DataFrame.
+        The lists are empty at end of input.
+        """
+        self._check_no_pending("read_columns")
+        return self._parser.read_columns(max_records)
+
     def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        # Native methods that read input (next_batch_nogil, next_ref_as_record,
+        # ...) would skip the records buffered by record iteration.
+        if name not in _NON_READING_PARSER_METHODS:
+            self._check_no_pending(name)
         return getattr(self._parser, name)
 
 
+def _import_optional(module: str, feature: str) -> Any:
+    """Import an optional dependency or raise ImportError naming the feature that needs it."""
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(
+            f"{feature} requires '{module}'; install it with: pip install {module}"
+        ) from e
+
+
+def _numpy_column(np: Any, batch: Any, name: str, typestr: str, owner: Any = None) -> Any:
+    """Zero-copy NumPy array over one buffer of a Mojo batch (empty if unallocated).
+
+    The array keeps `owner` (default: the batch) alive.
+    """
+    address, nbytes = batch.buffer_info(name)
+    if nbytes == 0:
+        return np.empty(0, dtype=np.dtype(typestr))
+    owner = batch if owner is None else owner
+    return np.asarray(_BufferView(owner, int(address), int(nbytes), typestr))
+
+
+class _BufferView:
+    """Exposes one batch buffer through the NumPy array interface without copying.
+
+    Holds a reference to the Mojo batch so the memory outlives every array built on it.
+    """
+
+    __slots__ = ("__array_interface__", "_owner")
+
+    def __init__(self, owner: Any, address: int, nbytes: int, typestr: str) -> None:
+        itemsize = int(typestr[2:])
+        self._owner = owner
+        self.__array_interface__ = {
+            "shape": (nbytes // itemsize,),
+            "typestr": typestr,
+            "data": (address, True),
+            "version": 3,
+        }
+
+
 class _IterableBatch:
     """Wrapper so that `for rec in batch` works. Delegates to the Mojo batch."""
 
-    __slots__ = ("_batch",)
+    # __weakref__: parser.batches recycles a batch once its wrapper is gone
+    __slots__ = ("_batch", "__weakref__")
 
     def __init__(self, batch: Any) -> None:
         self._batch = batch
 
-    def __iter__(self) -> _BatchIterator:
-        return _BatchIterator(self._batch.__iter__())
+    def __iter__(self) -> Iterator[FastqRecordProtocol]:
+        return iter(_column_records(self._batch.columns(), int(self._batch.quality_offset())))
+
+    def columns(self) -> dict[str, list[str]]:
+        """Return the records as {"id", "sequence", "quality"} lists of str (one native call)."""
+        return self._batch.columns()
 
     def get_record(self, index: int) -> FastqRecordProtocol:
         """Return the record at index with id, sequence, quality, phred_scores as properties."""
         return _wrap_record(self._batch.get_record(index))
 
+    def _numpy_buffer(self, np: Any, name: str) -> Any:
+        # arrays hold the wrapper, which keeps the batch from being recycled
+        return _numpy_column(np, self._batch, name, _BATCH_BUFFERS[name], owner=self)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Return read-only, zero-copy NumPy views of the batch buffers.
+
+        Keys: "sequence", "quality", "id" (uint8, all records concatenated) and
+        "ends", "id_ends" (int64 cumulative end offsets). Record i spans
+        [ends[i-1], ends[i]) in sequence/quality (start 0 for i == 0).
+        Phred scores: quality.astype(np.int16) - batch.quality_offset().
+        """
+        np = _import_optional("numpy", "FastqBatch.to_numpy()")
+        return {name: self._numpy_buffer(np, name) for name in _BATCH_BUFFERS}
+
+    def to_arrow(self, binary: bool = False) -> Any:
+        """Return a pyarrow.RecordBatch with id, sequence, and quality columns.
+
+        Column data buffers wrap the batch memory without copying; only the
+        (n + 1)-entry offsets are built, since Arrow offsets start with 0.
+        Columns are large_string, or large_binary when binary=True.
+        """
+        pa = _import_optional("pyarrow", "FastqBatch.to_arrow()")
+        np = _import_optional("numpy", "FastqBatch.to_arrow()")
+        n = int(self._batch.num_records())
+        arrow_type = pa.large_binary() if binary else pa.large_string()
+
+        def offsets_for(ends_name: str) -> Any:
+            offsets = np.zeros(n + 1, dtype=np.int64)
+            offsets[1:] = self._numpy_buffer(np, ends_name)
+            return pa.py_buffer(offsets)
+
+        def data_for(name: str) -> Any:
+            address, nbytes = self._batch.buffer_info(name)
+            if nbytes == 0:
+                return pa.py_buffer(b"")
+            return pa.foreign_buffer(int(address), int(nbytes), base=self)
+
+        seq_offsets = offsets_for("ends")
+        columns = [
+            pa.Array.from_buffers(arrow_type, n, [None, offsets_for("id_ends"), data_for("id")]),
+            pa.Array.from_buffers(arrow_type, n, [None, seq_offsets, data_for("sequence")]),
+            pa.Array.from_buffers(arrow_type, n, [None, seq_offsets, data_for("quality")]),
+        ]
+        return pa.RecordBatch.from_arrays(columns, names=["id", "sequence", "quality"])
+
+    def to_buffer(self, buf: Any) -> int:
+        """Serialize the batch into a writable buffer; return the bytes written.
+
+        Needs batch.serialized_size() bytes. Read it back with
+        batch_from_buffer(buf), in this or another process.
+        """
+        size = int(self._batch.serialized_size())
+        with memoryview(buf) as view:
+            if view.readonly or not view.c_contiguous:
+                raise TypeError("to_buffer() needs a writable, contiguous buffer")
+            with view.cast("B") as raw:
+                if len(raw) < size:
+                    raise ValueError(
+                        f"to_buffer(): buffer holds {len(raw)} bytes, batch needs {size}"
+                    )
+                target = ctypes.c_char.from_buffer(raw)
+                try:
+                    return int(self._batch.serialize_into(ctypes.addressof(target), len(raw)))
+                finally:
+                    del target
+
+    def to_shared_memory(self, name: str | None = None) -> Any:
+        """Serialize the batch into a new multiprocessing SharedMemory block.
+
+        Pass shm.name to the worker, which attaches with SharedMemory(name)
+        and reads the batch with batch_from_buffer(shm.buf). The caller owns
+        the block and must close() and unlink() it.
+        """
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=int(self._batch.serialized_size())
+        )
+        try:
+            self.to_buffer(shm.buf)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return shm
+
     def __getattr__(self, name: str) -> Any:
         return getattr(self._batch, name)
 
 
-class _BatchIterator:
-    """Iterator over a Mojo batch; raises StopIteration when exhausted."""
+class FastqBatchView:
+    """Zero-copy batch over a buffer written by batch.to_buffer() / to_shared_memory().
+
+    Reads records straight from the buffer (e.g. SharedMemory.buf in a worker
+    process); the buffer must stay alive and unchanged while the view or any
+    array from to_numpy() is in use. Call release() (or use the view as a
+    context manager) before closing a SharedMemory block. to_batch() copies
+    into a native FastqBatch.
+    """
+
+    __slots__ = ("_buffer", "_num_records", "_id_len", "_seq_len", "_quality_offset")
+
+    def __init__(self, buf: Any) -> None:
+        view = memoryview(buf)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        if len(view) < _BATCH_HEADER_SIZE:
+            raise ValueError("FastqBatchView: buffer is smaller than the header")
+        magic, version, n, id_len, seq_len, offset = _BATCH_HEADER.unpack_from(view)
+        if magic != _BATCH_MAGIC:
+            raise ValueError("FastqBatchView: buffer does not hold a FastqBatch")
+        if version != _BATCH_FORMAT_VERSION:
+            raise ValueError(f"FastqBatchView: unsupported format version {version}")
+        nbytes = _BATCH_HEADER_SIZE + 16 * n + id_len + 2 * seq_len
+        if len(view) < nbytes:
+            raise ValueError(
+                f"FastqBatchView: buffer holds {len(view)} bytes, header describes {nbytes}"
+            )
+        self._buffer = view[:nbytes]
+        self._num_records = n
+        self._id_len = id_len
+        self._seq_len = seq_len
+        self._quality_offset = offset
+
+    def _regions(self) -> dict[str, tuple[int, int]]:
+        """(offset, nbytes) of each array in the buffer."""
+        n = self._num_records
+        regions = {}
+        pos = _BATCH_HEADER_SIZE
+        for name, size in (
+            ("id_ends", 8 * n),
+            ("ends", 8 * n),
+            ("id", self._id_len),
+            ("sequence", self._seq_len),
+            ("quality", self._seq_len),
+        ):
+            regions[name] = (pos, size)
+            pos += size
+        return regions
+
+    def num_records(self) -> int:
+        return self._num_records
 
-    __slots__ = ("_it",)
+    def quality_offset(self) -> int:
+        return self._quality_offset
 
-    def __init__(self, mojo_batch_iter: Any) -> None:
-        self._it = mojo_batch_iter
+    def nbytes(self) -> int:
+        """Size of the serialized batch in the buffer."""
+        return len(self._buffer)
 
-    def __iter__(self) -> _BatchIterator:
+    def __len__(self) -> int:
+        return self._num_records
+
+    def to_numpy(self) -> dict[str, Any]:
+        """NumPy views of the arrays, with the same keys as FastqBatch.to_numpy()."""
+        np = _import_optional("numpy", "FastqBatchView.to_numpy()")
+        arrays = {}
+        for name, (offset, size) in self._regions().items():
+            dtype = np.dtype(_BATCH_BUFFERS[name])
+            if size == 0:
+                arrays[name] = np.empty(0, dtype=dtype)
+            else:
+                arrays[name] = np.frombuffer(
+                    self._buffer, dtype=dtype, count=size // dtype.itemsize, offset=offset
+                )
+        return arrays
+
+    def columns(self) -> dict[str, list[str]]:
+        """Return the records as {"id", "sequence", "quality"} lists of str."""
+        regions = self._regions()
+
+        def region(name: str) -> memoryview:
+            offset, size = regions[name]
+            return self._buffer[offset : offset + size]
+
+        id_ends = region("id_ends").cast("q").tolist()
+        ends = region("ends").cast("q").tolist()
+        ids = bytes(region("id"))
+        sequence = bytes(region("sequence")).decode("ascii")
+        quality = bytes(region("quality")).decode("ascii")
+        starts = [0] + ends[:-1]
+        id_starts = [0] + id_ends[:-1]
+        return {
+            "id": [ids[a:b].decode() for a, b in zip(id_starts, id_ends)],
+            "sequence": [sequence[a:b] for a, b in zip(starts, ends)],
+            "quality": [quality[a:b] for a, b in zip(starts, ends)],
+        }
+
+    def __iter__(self) -> Iterator[FastqRecordProtocol]:
+        return iter(_column_records(self.columns(), self._quality_offset))
+
+    def to_batch(self) -> _IterableBatch:
+        """Copy into a native FastqBatch (one memcpy per array)."""
+        address, size, owner = _buffer_address(self._buffer)
+        if address % 8:
+            # the native view reads the int64 arrays in place
+            address, size, owner = _buffer_address(bytearray(self._buffer))
+        batch = _mod.batch_from_buffer(address, size)
+        del owner
+        return _IterableBatch(batch)
+
+    def release(self) -> None:
+        """Drop the reference to the buffer (lets SharedMemory.close() succeed)."""
+        self._buffer.release()
+
+    def __enter__(self) -> FastqBatchView:
         return self
 
-    def __next__(self) -> FastqRecordProtocol:
-        return _next_or_stop(self._it)
+    def __exit__(self, *exc: object) -> None:
+        self.release()
+
+
+class _BedBatch:
+    """Wrapper adding NumPy export to a Mojo BedBatch. Delegates everything else."""
+
+    __slots__ = ("_batch",)
+
+    def __init__(self, batch: Any) -> None:
+        self._batch = batch
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Return read-only, zero-copy NumPy views of the batch columns.
+
+        Keys: "chrom_id" (uint32, indexes batch.chrom_names()), "start" and
+        "end" (uint64, 0-based half-open), "strand" (S1: b"+", b"-" or b"."),
+        "score" (uint16, 0 when absent), "name" (uint8, all names concatenated)
+        and "name_ends" (int64 cumulative end offsets into name).
+        """
+        np = _import_optional("numpy", "BedBatch.to_numpy()")
+        return {
+            name: _numpy_column(np, self._batch, name, typestr)
+            for name, typestr in _BED_BATCH_BUFFERS.items()
+        }
+
+    def __len__(self) -> int:
+        return int(self._batch.num_records())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._batch, name)
+
+
+class _IterableBedParser:
+    """Wrapper so that `for batch in bed.batches` works. Delegates to the Mojo BedParser."""
+
+    __slots__ = ("_parser",)
+
+    def __init__(self, parser: Any) -> None:
+        self._parser = parser
+
+    @property
+    def batches(self) -> _BatchesIterable:
+        """Iterable over batches (default size 65536): for batch in bed.batches"""
+        return _BatchesIterable(self, _DEFAULT_BED_BATCH_SIZE)  # type: ignore[arg-type]
+
+    def batches_with_size(self, batch_size: int) -> _BatchesIterable:
+        """Iterable over batches of the given size."""
+        return _BatchesIterable(self, batch_size)  # type: ignore[arg-type]
+
+    def next_batch(self, max_records: int = _DEFAULT_BED_BATCH_SIZE) -> _BedBatch:
+        """Return a batch of up to max_records rows (empty at end of input)."""
+        return _BedBatch(self._parser.next_batch(max_records))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._parser, name)
+
+
+class _QCStats:
+    """Wrapper accepting wrapped batches and adding NumPy export to a Mojo QCStats."""
+
+    __slots__ = ("_stats",)
+
+    def __init__(self, stats: Any) -> None:
+        self._stats = stats
+
+    def add(self, batch: Any, num_threads: int = 1) -> None:
+        """Count every read of `batch` (a batch from parser.batches or next_batch)."""
+        raw = batch._batch if isinstance(batch, _IterableBatch) else batch
+        self._stats.add(raw, num_threads)
+
+    def merge(self, other: Any) -> None:
+        """Add the counters of another QCStats (e.g. from a worker)."""
+        raw = other._stats if isinstance(other, _QCStats) else other
+        self._stats.merge(raw)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Return the counters as uint64 NumPy arrays (copies).
+
+        Keys: "position_quality" (max_length x 94, reads per Phred score at
+        each position), "position_bases" (max_length x 5: A, C, G, T,
+        N/other), "gc_histogram" (101 bins of percent GC per read),
+        "length_counts" (reads per length, 0..max_length) and "mean_quality"
+        (94 bins of per-read mean Phred).
+        """
+        np = _import_optional("numpy", "QCStats.to_numpy()")
+        arrays = {}
+        for name, columns in _QC_BUFFERS.items():
+            arr = _numpy_column(np, self._stats, name, "<u8").copy()
+            arrays[name] = arr.reshape(-1, columns) if columns else arr
+        return arrays
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stats, name)
+
+
+def qc_stats() -> _QCStats:
+    """Create a streaming FastQC-style QC accumulator.
+
+    Feed it batches while parsing (qc.add(batch, num_threads=4)); counts are
+    taken natively, split over worker threads and merged. Phred scores use
+    the batches' quality offset. qc.to_numpy() returns the counter arrays.
+    """
+    return _QCStats(_mod.qc_stats())
+
+
+class _KmerCounter:
+    """Wrapper accepting wrapped batches and adding NumPy export to a Mojo KmerCounter."""
+
+    __slots__ = ("_counter",)
+
+    def __init__(self, counter: Any) -> None:
+        self._counter = counter
+
+    def add(self, batch: Any, num_threads: int = 1) -> None:
+        """Count the k-mers of every read of `batch` (a batch from parser.batches or next_batch)."""
+        raw = batch._batch if isinstance(batch, _IterableBatch) else batch
+        self._counter.add(raw, num_threads)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Return the distinct k-mers and their counts as NumPy arrays (unordered).
+
+        Keys: "kmers" (uint64, 2 bits per base with A=0, C=1, G=2, T=3 and the
+        first base in the most significant bits) and "counts" (uint32). The
+        arrays share memory with a native snapshot taken by this call.
+        """
+        np = _import_optional("numpy", "KmerCounter.to_numpy()")
+        counts = self._counter.export()
+        return {
+            "kmers": _numpy_column(np, counts, "kmers", "<u8"),
+            "counts": _numpy_column(np, counts, "counts", "<u4"),
+        }
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._counter, name)
+
+
+def kmer_counter(k: int, canonical: bool = True, num_shards: int = 64) -> _KmerCounter:
+    """Create a sharded k-mer counter (k from 1 to 31).
+
+    Feed it batches while parsing (counter.add(batch, num_threads=4)); k-mers
+    containing non-ACGT bases are skipped, and with canonical=True a k-mer and
+    its reverse complement are counted together. counter.count("ACGT...")
+    looks up one k-mer; counter.to_numpy() exports all of them.
+    """
+    return _KmerCounter(_mod.kmer_counter(k, canonical, num_shards))
+
+
+class _Deduplicator:
+    """Wrapper accepting and returning wrapped batches around a Mojo FastqDeduplicator."""
+
+    __slots__ = ("_dedup",)
+
+    def __init__(self, dedup: Any) -> None:
+        self._dedup = dedup
+
+    def process(self, batch: Any) -> _IterableBatch:
+        """Return the records of `batch` whose sequence was not seen before."""
+        raw = batch._batch if isinstance(batch, _IterableBatch) else batch
+        return _IterableBatch(self._dedup.process(raw))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._dedup, name)
+
+
+def deduplicator(max_memory_bytes: int = 0, num_threads: int = 0) -> _Deduplicator:
+    """Create a streaming exact-duplicate filter for FASTQ batches.
+
+    dedup.process(batch) returns a batch holding the first occurrence of every
+    sequence across all batches processed so far; records_in(), records_out()
+    and duplicates() count them. Sequences are hashed natively (64-bit) into an
+    exact set, or, with max_memory_bytes > 0, into a fixed-size Bloom filter
+    that may drop a few unique reads as false positives.
+    """
+    return _Deduplicator(_mod.deduplicator(max_memory_bytes, num_threads))
+
+
+def batch_from_buffer(buf: Any) -> FastqBatchView:
+    """Return a zero-copy FastqBatchView over a batch serialized with to_buffer().
+
+    buf is any buffer (SharedMemory.buf, bytearray, mmap, bytes).
+    """
+    return FastqBatchView(buf)
+
+
+def bed_parser(path: str) -> _IterableBedParser:
+    """Create a BED parser that yields columnar batches of intervals.
+
+    Comment, blank, 'track' and 'browser' lines are skipped. Each batch stores
+    the chrom (as interned IDs), start, end, name, score and strand columns in
+    contiguous buffers; batch.to_numpy() exposes them without copying.
+
+    Returns:
+        A parser supporting:
+          - for batch in parser.batches (batches of 65536 rows)
+          - parser.has_more(), parser.next_batch(max_records)
+    """
+    return _IterableBedParser(_mod.bed_parser(path))
+
+
+class _PrefixedStream:
+    """Binary stream that replays bytes already read for sniffing, then the rest."""
+
+    __slots__ = ("_prefix", "_stream")
+
+    def __init__(self, prefix: bytes, stream: Any) -> None:
+        self._prefix = prefix
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._prefix:
+            return self._stream.read(size)
+        if size < 0:
+            data, self._prefix = self._prefix, b""
+            return data + self._stream.read()
+        data, self._prefix = self._prefix[:size], self._prefix[size:]
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        target = memoryview(buffer).cast("B")
+        if not self._prefix:
+            readinto = getattr(self._stream, "readinto", None)
+            if readinto is not None:
+                return readinto(target) or 0
+        data = self.read(len(target)) or b""
+        target[: len(data)] = data
+        return len(data)
+
+
+class _Py_buffer(ctypes.Structure):
+    """C layout of Py_buffer (stable ABI)."""
+
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.py_object),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("strides", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("suboffsets", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+_PyBUF_SIMPLE = 0
+_PyObject_GetBuffer = ctypes.pythonapi.PyObject_GetBuffer
+_PyObject_GetBuffer.argtypes = [ctypes.py_object, ctypes.POINTER(_Py_buffer), ctypes.c_int]
+_PyObject_GetBuffer.restype = ctypes.c_int
+_PyBuffer_Release = ctypes.pythonapi.PyBuffer_Release
+_PyBuffer_Release.argtypes = [ctypes.POINTER(_Py_buffer)]
+_PyBuffer_Release.restype = None
+
+
+class _PinnedBuffer:
+    """A buffer-protocol export of a contiguous object, released when dropped.
+
+    While it is alive the exporter keeps its memory in place (a bytearray
+    cannot be resized, a memoryview cannot be released).
+    """
+
+    __slots__ = ("_view",)
+
+    def __init__(self, data: Any) -> None:
+        self._view = _Py_buffer()
+        # PyBUF_SIMPLE accepts read-only exporters and raises BufferError
+        # for non-contiguous ones.
+        _PyObject_GetBuffer(data, ctypes.byref(self._view), _PyBUF_SIMPLE)
+
+    @property
+    def address(self) -> int:
+        return self._view.buf or 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._view.len
+
+    def __del__(self) -> None:
+        # A failed PyObject_GetBuffer leaves obj NULL; releasing is then a no-op.
+        _PyBuffer_Release(ctypes.byref(self._view))
+
+
+def _buffer_address(data: Any) -> tuple[int, int, Any]:
+    """Return (address, length, owner) of a bytes-like object.
+
+    Contiguous buffers, read-only or not (bytes, bytearray, memoryview, mmap),
+    are used in place; non-contiguous ones are copied. `owner` must stay
+    alive while the address is in use.
+    """
+    try:
+        pinned = _PinnedBuffer(data)
+    except BufferError:
+        pinned = _PinnedBuffer(memoryview(data).tobytes())
+    if pinned.nbytes == 0:
+        return 0, 0, pinned
+    return pinned.address, pinned.nbytes, pinned
+
+
+def _stream_read_into(stream: Any) -> Any:
+    """Adapt a binary stream to the native read_into(address, size) callback."""
+    readinto = getattr(stream, "readinto", None)
+
+    def read_into(address: int, size: int) -> int:
+        target = (ctypes.c_char * size).from_address(address)
+        if readinto is not None:
+            return readinto(target) or 0
+        data = stream.read(size)
+        ctypes.memmove(address, data, len(data))
+        return len(data)
+
+    return read_into
+
+
+def _stream_parser(stream: Any, quality_schema: str) -> _IterableParser:
+    # read() (and peek()) may return fewer bytes than asked for, e.g. on pipes
+    head = b""
+    while len(head) < len(_GZIP_MAGIC):
+        chunk = stream.read(len(_GZIP_MAGIC) - len(head))
+        if not chunk:
+            break
+        head += chunk
+    stream = _PrefixedStream(head, stream)
+    if head == _GZIP_MAGIC:
+        stream = gzip.GzipFile(fileobj=stream, mode="rb")
+    native = _mod.stream_parser(_stream_read_into(stream), quality_schema)
+    return _IterableParser(native, stream)
 
 
 def parser(
-    path: str,
+    source: str | os.PathLike[str] | bytes | bytearray | memoryview | Any,
     quality_schema: str = "generic",
     parallelism: int = 4,
 ) -> _IterableParser:
-    """Create a FASTQ parser for the given path and quality schema.
-
-    Supports plain (.fastq, .fq) and gzip-compressed (.fastq.gz, .fq.gz) files.
+    """Create a FASTQ parser for a path, in-memory bytes or a binary stream.
+
+    source may be:
+      - a path (str or os.PathLike) to a plain or gzip-compressed file;
+      - "-" for sys.stdin;
+      - bytes, bytearray or memoryview holding FASTQ data (parsed in place
+        through the buffer protocol, without a copy, unless gzip-compressed
+        or non-contiguous);
+      - a binary file-like object with read() or readinto() (sockets, pipes,
+        io.BytesIO, ...).
+    Gzip input is recognised from its magic bytes, not from the file name.
     quality_schema defaults to "generic"; other options: "sanger", "solexa",
     "illumina_1.3", "illumina_1.5", "illumina_1.8".
     For gzip files, parallelism is the number of decompression threads (default 4).
@@ -283,7 +1261,65 @@ def parser(
           - for batch in parser.batches (iterate over batches of 100 records; then for rec in batch)
           - parser.has_more(), parser.next_record(), parser.next_batch(max_records)
     """
-    return _IterableParser(_mod.parser(path, quality_schema, parallelism))
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        if bytes(memoryview(source)[: len(_GZIP_MAGIC)]) == _GZIP_MAGIC:
+            source = gzip.decompress(source)
+        address, length, owner = _buffer_address(source)
+        native = _mod.memory_parser(address, length, quality_schema)
+        return _IterableParser(native, owner)
+    if isinstance(source, str) and source == "-":
+        return _stream_parser(sys.stdin.buffer, quality_schema)
+    if isinstance(source, (str, os.PathLike)):
+        return _IterableParser(_mod.parser(os.fspath(source), quality_schema, parallelism))
+    if hasattr(source, "readinto") or hasattr(source, "read"):
+        return _stream_parser(source, quality_schema)
+    raise TypeError(
+        "parser() expects a path, bytes-like object or binary file-like object, "
+        f"got {type(source).__name__}"
+    )
+
+
+def shard_parser(
+    path: str | os.PathLike[str],
+    shard_index: int,
+    num_shards: int,
+    quality_schema: str = "generic",
+) -> _IterableParser:
+    """Create a FASTQ parser over one of num_shards byte ranges of a plain file.
+
+    The file is cut into num_shards equal byte ranges; shard shard_index parses
+    the records that start inside its range. Range ends are snapped to real
+    record starts (quality lines beginning with '@' are recognised), so running
+    every shard yields each record exactly once. Intended for
+    multiprocessing pools or cluster jobs that split one large file:
+
+        def count(i):
+            return sum(b.num_records() for b in blazeseq.shard_parser(path, i, 8).batches)
+
+        with multiprocessing.Pool(8) as pool:
+            total = sum(pool.map(count, range(8)))
+
+    Gzip-compressed files cannot be sharded (raises).
+    """
+    return _IterableParser(
+        _mod.shard_parser(os.fspath(path), shard_index, num_shards, quality_schema)
+    )
+
+
+def range_parser(
+    path: str | os.PathLike[str],
+    start: int,
+    end: int,
+    quality_schema: str = "generic",
+) -> _IterableParser:
+    """Create a FASTQ parser over the records that start in bytes [start, end) of a plain file."""
+    return _IterableParser(_mod.range_parser(os.fspath(path), start, end, quality_schema))
+
+
+def shard_range(path: str | os.PathLike[str], shard_index: int, num_shards: int) -> tuple[int, int]:
+    """Return the record-aligned byte range (start, end) that shard_parser() would parse."""
+    start, end = _mod.shard_range(os.fspath(path), shard_index, num_shards)
+    return int(start), int(end)
 
 
 create_parser = parser  # backward compatibility
@@ -306,16 +1342,40 @@ FastqRecord: type[FastqRecordProtocol] = cast(type[FastqRecordProtocol], _mod.Fa
 FastqBatch: type[FastqBatchProtocol] = cast(type[FastqBatchProtocol], _mod.FastqBatch)
 FastqParser = _mod.FastqParser
 FastqGZParser = _mod.FastqGZParser
+FastqMemoryParser = _mod.FastqMemoryParser
+FastqStreamParser = _mod.FastqStreamParser
+BedBatch: type[BedBatchProtocol] = cast(type[BedBatchProtocol], _mod.BedBatch)
+BedParser = _mod.BedParser
+QCStats = _mod.QCStats
+KmerCounter = _mod.KmerCounter
+FastqDeduplicator = _mod.FastqDeduplicator
 
 __all__ = [
     "parser",
+    "shard_parser",
+    "range_parser",
+    "shard_range",
+    "bed_parser",
+    "qc_stats",
+    "kmer_counter",
+    "deduplicator",
+    "batch_from_buffer",
     "create_parser",
     "mojopkg_path",
     "FastqRecord",
     "FastqBatch",
+    "FastqBatchView",
     "FastqParser",
     "FastqGZParser",
+    "FastqMemoryParser",
+    "FastqStreamParser",
+    "BedBatch",
+    "BedParser",
+    "QCStats",
+    "KmerCounter",
+    "FastqDeduplicator",
     "FastqRecordProtocol",
     "FastqBatchProtocol",
+    "BedBatchProtocol",
     "ParserProtocol",
 ]
@@ -1,7 +1,9 @@
 """Type stub for blazeseq: ensures 'parser' and other exports are known to type checkers."""
 
-from collections.abc import Iterator
-from typing import Protocol
+from collections.abc import AsyncIterator, Iterator
+from multiprocessing import shared_memory
+import os
+from typing import Any, BinaryIO, Protocol
 
 
 class FastqRecordProtocol(Protocol):
@@ -47,6 +49,122 @@ class FastqBatchProtocol(Protocol):
         """Iterate over records in the batch."""
         ...
 
+    def quality_offset(self) -> int:
+        """Return the Phred offset (33 or 64) of the batch."""
+        ...
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Zero-copy NumPy views: sequence/quality/id (uint8), ends/id_ends (int64). Requires numpy."""
+        ...
+
+    def columns(self) -> dict[str, list[str]]:
+        """Records as {"id", "sequence", "quality"} lists of str, built in one native call."""
+        ...
+
+    def to_arrow(self, binary: bool = False) -> Any:
+        """pyarrow.RecordBatch with id, sequence, quality columns (zero-copy data). Requires pyarrow."""
+        ...
+
+    def serialized_size(self) -> int:
+        """Bytes written by to_buffer(): a 64-byte header plus the five arrays."""
+        ...
+
+    def to_buffer(self, buf: Any) -> int:
+        """Serialize into a writable buffer (one memcpy per array); return the bytes written."""
+        ...
+
+    def to_shared_memory(self, name: str | None = None) -> shared_memory.SharedMemory:
+        """Serialize into a new SharedMemory block; the caller closes and unlinks it."""
+        ...
+
+
+class FastqBatchView:
+    """Zero-copy batch over a buffer written by to_buffer() / to_shared_memory()."""
+
+    def __init__(self, buf: Any) -> None: ...
+    def num_records(self) -> int: ...
+    def quality_offset(self) -> int: ...
+    def nbytes(self) -> int: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[FastqRecordProtocol]: ...
+    def columns(self) -> dict[str, list[str]]: ...
+    def to_numpy(self) -> dict[str, Any]:
+        """NumPy views into the buffer, same keys as FastqBatchProtocol.to_numpy(). Requires numpy."""
+        ...
+
+    def to_batch(self) -> FastqBatchProtocol:
+        """Copy into a native FastqBatch."""
+        ...
+
+    def release(self) -> None:
+        """Drop the buffer reference (needed before SharedMemory.close())."""
+        ...
+
+    def __enter__(self) -> FastqBatchView: ...
+    def __exit__(self, *exc: object) -> None: ...
+
+
+def batch_from_buffer(buf: Any) -> FastqBatchView:
+    """Zero-copy view of a batch serialized with to_buffer() / to_shared_memory()."""
+    ...
+
+
+class BedBatchProtocol(Protocol):
+    """Protocol for a columnar batch of BED intervals."""
+
+    def num_records(self) -> int:
+        """Return the number of rows in the batch."""
+        ...
+
+    def __len__(self) -> int: ...
+    def num_fields(self) -> int:
+        """Return the number of BED columns (3-6) present in every row."""
+        ...
+
+    def chrom_names(self) -> list[str]:
+        """Interned chromosome names; the chrom_id column indexes this list."""
+        ...
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Zero-copy NumPy views: chrom_id (uint32), start/end (uint64), strand (S1), score (uint16), name (uint8), name_ends (int64). Requires numpy."""
+        ...
+
+
+class BedParserProtocol(Protocol):
+    """Protocol for the BED parser returned by bed_parser()."""
+
+    def has_more(self) -> bool:
+        """Return True if there may be more rows to read."""
+        ...
+
+    def next_batch(self, max_records: int = 65536) -> BedBatchProtocol:
+        """Return a batch of up to max_records rows (empty at end of input)."""
+        ...
+
+    def batches_with_size(self, batch_size: int) -> Iterator[BedBatchProtocol]:
+        """Iterable over batches of the given size."""
+        ...
+
+    @property
+    def batches(self) -> Iterator[BedBatchProtocol]:
+        """Iterable over batches (default size 65536): for batch in bed.batches."""
+        ...
+
+
+class BatchPrefetcherProtocol(Protocol):
+    """Batches parsed ahead on a background thread; supports for and async for."""
+
+    def __iter__(self) -> Iterator[FastqBatchProtocol]: ...
+    def __next__(self) -> FastqBatchProtocol: ...
+    def __aiter__(self) -> AsyncIterator[FastqBatchProtocol]: ...
+    async def __anext__(self) -> FastqBatchProtocol: ...
+    def close(self) -> None:
+        """Stop the worker thread and discard batches parsed ahead."""
+        ...
+
+    def __enter__(self) -> BatchPrefetcherProtocol: ...
+    def __exit__(self, *exc: object) -> None: ...
+
 
 class ParserProtocol(Protocol):
     """Protocol for the FASTQ parser returned by parser()."""
@@ -67,6 +185,30 @@ class ParserProtocol(Protocol):
         """Return a batch of up to max_records records."""
         ...
 
+    def next_batch_nogil(self, max_records: int) -> FastqBatchProtocol:
+        """Like next_batch, but parses with the GIL released."""
+        ...
+
+    def next_batch_into(
+        self, batch: FastqBatchProtocol, max_records: int, max_bytes: int = 0
+    ) -> int:
+        """Clear batch and refill it in place (buffers reused); stop at max_bytes of record data if > 0."""
+        ...
+
+    def read_columns(self, max_records: int) -> dict[str, list[str]]:
+        """Parse up to max_records records into {"id", "sequence", "quality"} lists of str (empty at EOF)."""
+        ...
+
+    def quality_offset(self) -> int:
+        """Phred offset of the quality schema."""
+        ...
+
+    def prefetch_batches(
+        self, batch_size: int = 100, prefetch: int = 2
+    ) -> BatchPrefetcherProtocol:
+        """Batches parsed up to `prefetch` ahead on a background thread (GIL released)."""
+        ...
+
     @property
     def records(self) -> Iterator[FastqRecordProtocol]:
         """Iterable over records: for rec in parser.records."""
@@ -77,15 +219,22 @@ class ParserProtocol(Protocol):
         """Iterable over batches (default size 100): for batch in parser.batches."""
         ...
 
+    def batches_with_size(
+        self, batch_size: int, max_bytes: int = 0
+    ) -> Iterator[FastqBatchProtocol]:
+        """Iterable over batches of up to batch_size records and, if > 0, about max_bytes of record data."""
+        ...
+
 
 def parser(
-    path: str,
+    source: str | os.PathLike[str] | bytes | bytearray | memoryview | BinaryIO,
     quality_schema: str = "generic",
     parallelism: int = 4,
 ) -> ParserProtocol:
-    """Create a FASTQ parser for the given path and quality schema.
+    """Create a FASTQ parser for a path, in-memory bytes or a binary stream.
 
-    Supports plain (.fastq, .fq) and gzip-compressed (.fastq.gz, .fq.gz) files.
+    source is a path, "-" for stdin, a bytes-like object (parsed in place) or
+    a binary file-like object. Gzip input is detected from its magic bytes.
     quality_schema defaults to "generic"; other options: "sanger", "solexa",
     "illumina_1.3", "illumina_1.5", "illumina_1.8".
     For gzip files, parallelism is the number of decompression threads (default 4).
@@ -96,6 +245,120 @@ def parser(
     ...
 
 
+def shard_parser(
+    path: str | os.PathLike[str],
+    shard_index: int,
+    num_shards: int,
+    quality_schema: str = "generic",
+) -> ParserProtocol:
+    """Create a FASTQ parser over shard shard_index of num_shards of a plain file.
+
+    Every record of the file belongs to exactly one shard.
+    """
+    ...
+
+
+def range_parser(
+    path: str | os.PathLike[str],
+    start: int,
+    end: int,
+    quality_schema: str = "generic",
+) -> ParserProtocol:
+    """Create a FASTQ parser over the records that start in bytes [start, end)."""
+    ...
+
+
+def shard_range(path: str | os.PathLike[str], shard_index: int, num_shards: int) -> tuple[int, int]:
+    """Record-aligned byte range (start, end) of one shard."""
+    ...
+
+
+class QCStatsProtocol(Protocol):
+    """Streaming FastQC-style counters returned by qc_stats()."""
+
+    def add(self, batch: FastqBatchProtocol, num_threads: int = 1) -> None:
+        """Count every read of a batch, split over num_threads workers (0 = all cores)."""
+        ...
+
+    def merge(self, other: QCStatsProtocol) -> None:
+        """Add the counters of another QCStats."""
+        ...
+
+    def num_reads(self) -> int: ...
+    def num_bases(self) -> int: ...
+    def max_length(self) -> int:
+        """Longest read length; rows of the per-position arrays."""
+        ...
+
+    def quality_offset(self) -> int:
+        """Phred offset of the counted reads (0 before the first add)."""
+        ...
+
+    def to_numpy(self) -> dict[str, Any]:
+        """uint64 copies: position_quality (max_length x 94), position_bases (max_length x 5: A, C, G, T, N/other), gc_histogram (101), length_counts (max_length + 1), mean_quality (94). Requires numpy."""
+        ...
+
+
+def qc_stats() -> QCStatsProtocol:
+    """Create a streaming FastQC-style QC accumulator fed with parsed batches."""
+    ...
+
+
+class KmerCounterProtocol(Protocol):
+    """Sharded k-mer counter returned by kmer_counter()."""
+
+    def add(self, batch: FastqBatchProtocol, num_threads: int = 1) -> None:
+        """Count the k-mers of every read of a batch on num_threads workers (0 = all cores)."""
+        ...
+
+    def count(self, kmer: str) -> int:
+        """Count of one k-mer (canonicalized if the counter is)."""
+        ...
+
+    def k(self) -> int: ...
+    def num_distinct(self) -> int: ...
+    def total(self) -> int:
+        """Number of k-mers counted (including repeats)."""
+        ...
+
+    def to_numpy(self) -> dict[str, Any]:
+        """kmers (uint64, 2-bit packed, A=0 C=1 G=2 T=3, first base most significant) and counts (uint32). Requires numpy."""
+        ...
+
+
+def kmer_counter(k: int, canonical: bool = True, num_shards: int = 64) -> KmerCounterProtocol:
+    """Create a sharded k-mer counter (1 <= k <= 31) fed with parsed batches."""
+    ...
+
+
+class DeduplicatorProtocol(Protocol):
+    """Streaming exact-duplicate filter returned by deduplicator()."""
+
+    def process(self, batch: FastqBatchProtocol) -> FastqBatchProtocol:
+        """Return the records whose sequence was not seen in this or an earlier batch."""
+        ...
+
+    def count(self, sequence: str) -> int:
+        """How often a sequence was seen (exact backend only)."""
+        ...
+
+    def records_in(self) -> int: ...
+    def records_out(self) -> int: ...
+    def duplicates(self) -> int: ...
+    def nbytes(self) -> int: ...
+    def reset(self) -> None: ...
+
+
+def deduplicator(max_memory_bytes: int = 0, num_threads: int = 0) -> DeduplicatorProtocol:
+    """Create a streaming duplicate filter (exact set, or Bloom filter of max_memory_bytes)."""
+    ...
+
+
+def bed_parser(path: str) -> BedParserProtocol:
+    """Create a BED parser yielding columnar batches of intervals (see BedBatchProtocol.to_numpy)."""
+    ...
+
+
 def create_parser(
     path: str,
     quality_schema: str = "generic",
@@ -114,4 +377,11 @@ def mojopkg_path() -> str:
 FastqRecord: type[FastqRecordProtocol]  # Single FASTQ record
 FastqBatch: type[FastqBatchProtocol]  # Batch of FASTQ records
 FastqParser: type  # Parser for plain FASTQ files (.fastq, .fq)
-FastqGZParser: type  # Parser for gzip-compressed FASTQ (.fastq.gz, .fq.gz)
+FastqGZParser: type  # Parser for gzip-compressed FASTQ files
+FastqMemoryParser: type  # Parser over an in-memory buffer
+FastqStreamParser: type  # Parser over a binary file-like object
+BedBatch: type[BedBatchProtocol]  # Columnar batch of BED intervals
+BedParser: type  # Parser for plain BED files
+QCStats: type  # Streaming QC accumulator (wrapped by qc_stats())
+KmerCounter: type  # Sharded k-mer counter (wrapped by kmer_counter())
+FastqDeduplicator: type  # Streaming duplicate filter (wrapped by deduplicator())
@@ -6,15 +6,18 @@ after building the Mojo extension, or install a wheel from CI/PyPI).
 
 Run from project root:
   pip install -e python/   # after building .so into python/blazeseq/_extension/
-  python tests/test_python_bindings.py
+  python tests/test_python_bindings.py   # or: pytest -q tests/test_python_bindings.py
 
 Or with pixi (after building the extension and wheel):
   pixi run python tests/test_python_bindings.py
 """
 
+import io
 import os
 import sys
 
+import pytest
+
 # Ensure the Python package is found (python/blazeseq), not the repo-root blazeseq/ Mojo package
 _repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _python_dir = os.path.join(_repo_root, "python")
@@ -26,6 +29,7 @@ import blazeseq
 FASTQ_PATH = os.path.join(
     _repo_root, "tests", "test_data", "fastq_parser", "example.fastq"
 )
+BED_PATH = os.path.join(_repo_root, "tests", "test_data", "bed_parser", "bed6.bed")
 
 
 def test_create_parser_and_next_record():
@@ -118,6 +122,369 @@ def test_batch_iterator_protocol():
     assert recs[1].id == "EAS54_6_R1_2_1_540_792"
 
 
+def test_batch_to_numpy():
+    """to_numpy() exposes the SoA buffers; slices match the records."""
+    np = pytest.importorskip("numpy")
+    parser = blazeseq.parser(FASTQ_PATH, "generic")
+    batch = parser.next_batch(3)
+    cols = batch.to_numpy()
+    assert cols["ends"].dtype == np.int64
+    assert len(cols["ends"]) == 3
+    assert not cols["sequence"].flags.writeable
+    ends = cols["ends"]
+    for i in range(3):
+        start = 0 if i == 0 else int(ends[i - 1])
+        rec = batch.get_record(i)
+        assert cols["sequence"][start : int(ends[i])].tobytes().decode() == rec.sequence
+        assert cols["quality"][start : int(ends[i])].tobytes().decode() == rec.quality
+    phred = cols["quality"][: int(ends[0])].astype(np.int16) - batch.quality_offset()
+    assert phred.tolist() == batch.get_record(0).phred_scores
+
+
+def test_batch_to_arrow():
+    """to_arrow() returns a RecordBatch with id/sequence/quality columns."""
+    pytest.importorskip("pyarrow")
+    parser = blazeseq.parser(FASTQ_PATH, "generic")
+    batch = parser.next_batch(3)
+    table = batch.to_arrow()
+    assert table.num_rows == 3
+    assert table.column_names == ["id", "sequence", "quality"]
+    assert table.column("id")[0].as_py() == "EAS54_6_R1_2_1_413_324"
+    assert table.column("sequence")[2].as_py() == batch.get_record(2).sequence
+    raw = batch.to_arrow(binary=True)
+    assert raw.column("quality")[1].as_py() == batch.get_record(1).quality.encode()
+
+
+def test_prefetch_batches():
+    """prefetch_batches() yields the same batches as next_batch, in order."""
+    parser = blazeseq.parser(FASTQ_PATH, "generic")
+    ids = []
+    with parser.prefetch_batches(batch_size=2, prefetch=2) as batches:
+        for batch in batches:
+            ids.extend(rec.id for rec in batch)
+    assert len(ids) == 3
+    assert ids[0] == "EAS54_6_R1_2_1_413_324"
+    assert ids[1] == "EAS54_6_R1_2_1_540_792"
+
+
+def test_prefetch_batches_async():
+    """prefetch_batches() also supports async for."""
+    import asyncio
+
+    async def collect():
+        parser = blazeseq.parser(FASTQ_PATH, "generic")
+        counts = []
+        async for batch in parser.prefetch_batches(batch_size=2):
+            counts.append(batch.num_records())
+        return counts
+
+    assert asyncio.run(collect()) == [2, 1]
+
+
+def test_prefetch_batches_close_early():
+    """close() stops the worker without consuming every batch."""
+    parser = blazeseq.parser(FASTQ_PATH, "generic")
+    batches = parser.prefetch_batches(batch_size=1, prefetch=1)
+    assert next(batches).num_records() == 1
+    batches.close()
+    try:
+        next(batches)
+        raise AssertionError("expected StopIteration after close()")
+    except StopIteration:
+        pass
+
+
+def test_prefetch_batches_close_while_awaiting():
+    """close() ends an async for step that is waiting on the worker."""
+    import asyncio
+
+    async def run():
+        parser = blazeseq.parser(FASTQ_PATH, "generic")
+        batches = parser.prefetch_batches(batch_size=1, prefetch=1)
+        await batches.__anext__()
+        pending = asyncio.ensure_future(batches.__anext__())
+        await asyncio.sleep(0)
+        batches.close()
+        try:
+            await asyncio.wait_for(pending, timeout=5)
+        except StopAsyncIteration:
+            pass
+
+    asyncio.run(run())
+
+
+def test_bed_batch_to_numpy():
+    """bed_parser() batches expose BED6 columns as NumPy arrays."""
+    np = pytest.importorskip("numpy")
+    bed = blazeseq.bed_parser(BED_PATH)
+    batches = list(bed.batches)
+    assert len(batches) == 1
+    batch = batches[0]
+    assert batch.num_records() == 2
+    assert batch.num_fields() == 6
+    assert batch.chrom_names() == ["chr22"]
+    cols = batch.to_numpy()
+    assert cols["start"].dtype == np.uint64
+    assert cols["start"].tolist() == [1000, 2000]
+    assert cols["end"].tolist() == [5000, 6000]
+    assert cols["chrom_id"].tolist() == [0, 0]
+    assert cols["strand"].tolist() == [b"+", b"-"]
+    assert cols["score"].tolist() == [960, 900]
+    assert cols["name"].tobytes() == b"mRNA1mRNA2"
+    assert cols["name_ends"].tolist() == [5, 10]
+    assert bed.next_batch().num_records() == 0
+
+
+def test_qc_stats():
+    """qc_stats() counts match the records; to_numpy() shapes the per-position arrays."""
+    np = pytest.importorskip("numpy")
+    records = list(blazeseq.parser(FASTQ_PATH, "generic").records)
+    qc = blazeseq.qc_stats()
+    for batch in blazeseq.parser(FASTQ_PATH, "generic").batches_with_size(2):
+        qc.add(batch, num_threads=2)
+    assert qc.num_reads() == len(records)
+    assert qc.num_bases() == sum(len(r) for r in records)
+    max_len = max(len(r) for r in records)
+    assert qc.max_length() == max_len
+    arrays = qc.to_numpy()
+    assert arrays["position_quality"].shape == (max_len, 94)
+    assert arrays["position_bases"].shape == (max_len, 5)
+    assert arrays["gc_histogram"].sum() == len(records)
+    assert int(arrays["length_counts"][max_len]) >= 1
+    first = [r.phred_scores[0] for r in records]
+    assert arrays["position_quality"][0].sum() == len(records)
+    expected = np.bincount(first, minlength=94)[:94]
+    assert arrays["position_quality"][0].tolist() == expected.tolist()
+
+
+def test_kmer_counter():
+    """kmer_counter() matches a pure-Python canonical k-mer count."""
+    np = pytest.importorskip("numpy")
+    k = 5
+    complement = str.maketrans("ACGT", "TGCA")
+    expected = {}
+    for rec in blazeseq.parser(FASTQ_PATH, "generic").records:
+        seq = rec.sequence.upper()
+        for i in range(len(seq) - k + 1):
+            kmer = seq[i : i + k]
+            if set(kmer) <= set("ACGT"):
+                key = min(kmer, kmer.translate(complement)[::-1])
+                expected[key] = expected.get(key, 0) + 1
+    counter = blazeseq.kmer_counter(k)
+    for batch in blazeseq.parser(FASTQ_PATH, "generic").batches_with_size(2):
+        counter.add(batch, num_threads=2)
+    assert counter.k() == k
+    assert counter.num_distinct() == len(expected)
+    assert counter.total() == sum(expected.values())
+    for kmer, n in expected.items():
+        assert counter.count(kmer) == n
+    arrays = counter.to_numpy()
+    assert arrays["kmers"].dtype == np.uint64
+    assert arrays["counts"].dtype == np.uint32
+    assert len(arrays["kmers"]) == len(expected)
+    assert int(arrays["counts"].sum()) == sum(expected.values())
+
+
+def test_deduplicator():
+    """deduplicator() keeps the first occurrence of each sequence across batches."""
+    records = list(blazeseq.parser(FASTQ_PATH, "generic").records)
+    dedup = blazeseq.deduplicator(num_threads=2)
+    kept = []
+    for _ in range(2):
+        for batch in blazeseq.parser(FASTQ_PATH, "generic").batches_with_size(2):
+            kept.extend(rec.sequence for rec in dedup.process(batch))
+    expected = list(dict.fromkeys(r.sequence for r in records))
+    assert kept == expected
+    assert dedup.records_in() == 2 * len(records)
+    assert dedup.records_out() == len(expected)
+    assert dedup.duplicates() == 2 * len(records) - len(expected)
+    assert dedup.count(records[0].sequence) == 2 * sum(
+        r.sequence == records[0].sequence for r in records
+    )
+
+
+def test_read_columns():
+    """read_columns() and batch.columns() return the same data as record iteration."""
+    records = list(blazeseq.parser(FASTQ_PATH, "generic").records)
+    parser = blazeseq.parser(FASTQ_PATH, "generic")
+    columns = parser.read_columns(2)
+    assert set(columns) == {"id", "sequence", "quality"}
+    assert columns["id"] == [r.id for r in records[:2]]
+    assert columns["sequence"] == [r.sequence for r in records[:2]]
+    assert columns["quality"] == [r.quality for r in records[:2]]
+    rest = parser.read_columns(10)
+    assert rest["id"] == [r.id for r in records[2:]]
+    assert parser.read_columns(10) == {"id": [], "sequence": [], "quality": []}
+
+    batch = blazeseq.parser(FASTQ_PATH, "generic").next_batch(10)
+    assert batch.columns()["sequence"] == [r.sequence for r in records]
+    native = batch.get_record(0)
+    from_columns = next(iter(batch))
+    assert from_columns.phred_scores == native.phred_scores
+    assert len(from_columns) == len(native.sequence)
+
+    iterating = blazeseq.parser(FASTQ_PATH, "generic")
+    assert next(iterating).id == records[0].id
+    try:
+        iterating.next_batch_nogil(1)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected RuntimeError while records are buffered")
+
+
+class _Trickle(io.RawIOBase):
+    """Raw stream that returns at most one byte per read, like a slow pipe."""
+
+    def __init__(self, payload):
+        self._payload = io.BytesIO(payload)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._payload.read(min(1, len(buffer)))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def test_parser_sources():
+    """bytes, bytearray, gzip bytes and file-like objects parse like the file."""
+    import gzip
+    import io
+
+    expected = [(r.id, r.sequence, r.quality) for r in blazeseq.parser(FASTQ_PATH).records]
+    with open(FASTQ_PATH, "rb") as f:
+        data = f.read()
+
+    def parsed(source):
+        return [(r.id, r.sequence, r.quality) for r in blazeseq.parser(source).records]
+
+    assert parsed(data) == expected
+    assert parsed(bytearray(data)) == expected
+    assert parsed(memoryview(data)) == expected
+    assert parsed(gzip.compress(data)) == expected
+    assert parsed(io.BytesIO(data)) == expected
+    assert parsed(io.BufferedReader(io.BytesIO(gzip.compress(data)))) == expected
+    # a pipe may hand out fewer bytes than asked for, even through peek()
+    assert parsed(io.BufferedReader(_Trickle(gzip.compress(data)), 1)) == expected
+    assert parsed(b"") == []
+    batch = blazeseq.parser(io.BytesIO(data)).next_batch(100)
+    assert batch.num_records() == len(expected)
+    try:
+        blazeseq.parser(42)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("expected TypeError for a non-source argument")
+
+
+def test_parser_memoryview_in_place():
+    """A read-only memoryview is parsed from its own memory, not a copy."""
+    import ctypes
+
+    with open(FASTQ_PATH, "rb") as f:
+        data = f.read()
+    view = memoryview(data)[1:]
+    assert view.readonly
+    address = ctypes.cast(ctypes.c_char_p(data), ctypes.c_void_p).value
+    parser = blazeseq.parser(memoryview(data))
+    assert parser._source.address == address
+    assert parser.next_record().id == blazeseq.parser(FASTQ_PATH).next_record().id
+    # a slice is used in place too, at its offset into the bytes object
+    assert blazeseq._buffer_address(view)[:2] == (address + 1, len(data) - 1)
+
+
+def test_shard_parser():
+    """Shards of a file cover every record exactly once, in order."""
+    expected = [r.id for r in blazeseq.parser(FASTQ_PATH).records]
+    size = os.path.getsize(FASTQ_PATH)
+    for num_shards in (1, 2, 3, 7, 50):
+        ids = []
+        previous_end = 0
+        for i in range(num_shards):
+            start, end = blazeseq.shard_range(FASTQ_PATH, i, num_shards)
+            assert start == previous_end
+            previous_end = end
+            ids.extend(r.id for r in blazeseq.shard_parser(FASTQ_PATH, i, num_shards).records)
+        assert ids == expected
+        assert previous_end == size
+    head = [r.id for r in blazeseq.range_parser(FASTQ_PATH, 0, 1).records]
+    assert head == expected[:1]
+    try:
+        blazeseq.shard_parser(FASTQ_PATH, 3, 3)
+    except Exception as e:
+        assert "shard_index" in str(e)
+    else:
+        raise AssertionError("expected an error for shard_index >= num_shards")
+
+
+def test_batch_shared_memory():
+    """A batch round-trips through shared memory and a caller buffer."""
+    batch = blazeseq.parser(FASTQ_PATH, "generic").next_batch(100)
+    columns = batch.columns()
+    shm = batch.to_shared_memory()
+    try:
+        with blazeseq.batch_from_buffer(shm.buf) as view:
+            assert view.num_records() == batch.num_records()
+            assert view.nbytes() == batch.serialized_size()
+            assert view.quality_offset() == batch.quality_offset()
+            assert view.columns() == columns
+            assert [r.sequence for r in view] == columns["sequence"]
+            assert view.to_batch().columns() == columns
+    finally:
+        shm.close()
+        shm.unlink()
+
+    buf = bytearray(batch.serialized_size())
+    assert batch.to_buffer(buf) == len(buf)
+    assert blazeseq.batch_from_buffer(bytes(buf)).columns() == columns
+    try:
+        batch.to_buffer(bytearray(16))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for a short buffer")
+    try:
+        blazeseq.batch_from_buffer(bytes(128))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for a buffer without a batch")
+
+
+def test_recycled_batches():
+    """Recycled and byte-budgeted batches hold the same records as next_batch."""
+    expected = [r.id for r in blazeseq.parser(FASTQ_PATH).records]
+    ids = []
+    for batch in blazeseq.parser(FASTQ_PATH).batches_with_size(1):
+        ids.extend(batch.columns()["id"])
+    assert ids == expected
+    kept = list(blazeseq.parser(FASTQ_PATH).batches_with_size(1))
+    assert [b.columns()["id"][0] for b in kept] == expected
+
+    budgeted = list(blazeseq.parser(FASTQ_PATH).batches_with_size(100, max_bytes=1))
+    assert [b.num_records() for b in budgeted] == [1] * len(expected)
+
+    parser = blazeseq.parser(FASTQ_PATH)
+    batch = parser.next_batch(1)
+    total = batch.num_records()
+    while parser.next_batch_into(batch, 2) > 0:
+        total += batch.num_records()
+    assert batch.num_records() == 0
+    assert total == len(expected)
+
+
+def _run_optional(test):
+    """Run a test that needs an optional dependency; report a skip instead of failing."""
+    try:
+        test()
+    except pytest.skip.Exception as e:
+        print(f"{test.__name__} skipped: {e}")
+    else:
+        print(f"{test.__name__} passed")
+
+
 def main():
     test_create_parser_and_next_record()
     print("test_create_parser_and_next_record passed")
@@ -129,6 +496,33 @@ def main():
     print("test_parser_iterator_protocol passed")
     test_batch_iterator_protocol()
     print("test_batch_iterator_protocol passed")
+    _run_optional(test_batch_to_numpy)
+    _run_optional(test_batch_to_arrow)
+    test_prefetch_batches()
+    print("test_prefetch_batches passed")
+    test_prefetch_batches_async()
+    print("test_prefetch_batches_async passed")
+    test_prefetch_batches_close_early()
+    print("test_prefetch_batches_close_early passed")
+    test_prefetch_batches_close_while_awaiting()
+    print("test_prefetch_batches_close_while_awaiting passed")
+    _run_optional(test_bed_batch_to_numpy)
+    _run_optional(test_qc_stats)
+    _run_optional(test_kmer_counter)
+    test_deduplicator()
+    print("test_deduplicator passed")
+    test_read_columns()
+    print("test_read_columns passed")
+    test_parser_sources()
+    print("test_parser_sources passed")
+    test_parser_memoryview_in_place()
+    print("test_parser_memoryview_in_place passed")
+    test_shard_parser()
+    print("test_shard_parser passed")
+    test_batch_shared_memory()
+    print("test_batch_shared_memory passed")
+    test_recycled_batches()
+    print("test_recycled_batches passed")
     print("All Python binding tests passed.")
 
 